@@ -1,13 +1,9 @@
+import importlib
 import streamlit as st
 from utils.data_loader import load_data
 from utils.styles import apply_custom_styles
 from components.sidebar import render_sidebar
 from components.kpis import render_kpis
-from tabs.evolucao_temporal import render_evolucao_temporal
-from tabs.analise_genero import render_analise_genero
-from tabs.duracao_formato import render_duracao_formato
-from tabs.mercado_global import render_mercado_global
-from tabs.hall_fama import render_hall_fama
 
 st.set_page_config(
     page_title="Dashboard de Cinema IMDb",
@@ -39,25 +35,21 @@ render_kpis(df_filtered, year_range)
 
 st.markdown("---")
 
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    " 🎞️ Visão Geral ", 
-    " 🎭 Análise por Gênero ", 
-    " ⏱️ Duração & Formato ", 
-    " 🌍 Mercado Global ", 
-    " 🌟 Hall da Fama "
-])
+# widgets of sections that are not rendered lose their state; reassigning
+# the keys keeps the selections when the user comes back to the section
+for key in ("galeria_criterio", "hall_fama_cargo", "hall_fama_decada"):
+    if key in st.session_state:
+        st.session_state[key] = st.session_state[key]
 
-with tab1:
-    render_evolucao_temporal(df_filtered, df_crew, selected_genres, df)
+SECTIONS = {
+    "🎞️ Visão Geral": ("tabs.evolucao_temporal", "render_evolucao_temporal", (df_filtered, df_crew, selected_genres, df)),
+    "🎭 Análise por Gênero": ("tabs.analise_genero", "render_analise_genero", (df_filtered,)),
+    "⏱️ Duração & Formato": ("tabs.duracao_formato", "render_duracao_formato", (df_filtered,)),
+    "🌍 Mercado Global": ("tabs.mercado_global", "render_mercado_global", (df_filtered,)),
+    "🌟 Hall da Fama": ("tabs.hall_fama", "render_hall_fama", (df_crew,)),
+}
 
-with tab2:
-    render_analise_genero(df_filtered)
+section = st.radio("Seção", list(SECTIONS), horizontal=True, label_visibility="collapsed", key="section")
 
-with tab3:
-    render_duracao_formato(df_filtered)
-
-with tab4:
-    render_mercado_global(df_filtered)
-
-with tab5:
-    render_hall_fama(df_crew)
+module_name, renderer, args = SECTIONS[section]
+getattr(importlib.import_module(module_name), renderer)(*args)
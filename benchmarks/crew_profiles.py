@@ -0,0 +1,101 @@
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.crew_profiles import CHUNKSIZE, TSV_OPTIONS, build_crew_profiles
+
+CATEGORIES = ["actor", "actress", "director", "writer", "producer", "self", "composer"]
+
+
+def write_tsv(df, path):
+    df.to_csv(path, sep='\t', index=False, na_rep='\\N')
+
+
+def generate_dumps(data_dir, n_principals, seed=42):
+    rng = np.random.default_rng(seed)
+    n_titles = max(n_principals // 10, 1)
+    n_names = max(n_principals // 5, 1)
+
+    # the dumps are sorted by the tconst string, so 8-digit ids (tt10000001...)
+    # are interleaved with the 7-digit ones instead of following them
+    title_ids = np.arange(1, n_titles + 1)
+    title_ids[n_titles // 2:] += 10_000_000 - n_titles // 2
+    tconst = pd.Series(title_ids).map("tt{:07d}".format).sort_values(ignore_index=True)
+    nconst = pd.Series(np.arange(1, n_names + 1)).map("nm{:07d}".format)
+
+    write_tsv(pd.DataFrame({
+        'tconst': tconst,
+        'titleType': rng.choice(["movie", "short", "tvEpisode"], n_titles, p=[0.5, 0.2, 0.3]),
+        'primaryTitle': "Title " + tconst,
+        'originalTitle': "Title " + tconst,
+        'isAdult': 0,
+        'startYear': rng.integers(1900, 2025, n_titles),
+        'endYear': None,
+        'runtimeMinutes': rng.integers(60, 180, n_titles),
+        'genres': "Drama",
+    }), data_dir / "title.basics.tsv")
+
+    rated = rng.random(n_titles) < 0.7
+    write_tsv(pd.DataFrame({
+        'tconst': tconst[rated],
+        'averageRating': rng.uniform(1, 10, rated.sum()).round(1),
+        'numVotes': rng.integers(5, 2_000_000, rated.sum()),
+    }), data_dir / "title.ratings.tsv")
+
+    title_idx = np.sort(rng.integers(0, n_titles, n_principals))
+    write_tsv(pd.DataFrame({
+        'tconst': tconst.values[title_idx],
+        'ordering': 1,
+        'nconst': nconst.values[rng.integers(0, n_names, n_principals)],
+        'category': rng.choice(CATEGORIES, n_principals),
+        'job': None,
+        'characters': None,
+    }), data_dir / "title.principals.tsv")
+
+    write_tsv(pd.DataFrame({
+        'nconst': nconst,
+        'primaryName': "Name " + nconst,
+        'birthYear': None,
+        'deathYear': None,
+        'primaryProfession': None,
+        'knownForTitles': None,
+    }), data_dir / "name.basics.tsv")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede a vazão do gerador de perfis de equipe.")
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Linhas sintéticas de title.principals")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE, help="Linhas lidas por bloco")
+    parser.add_argument("--data-dir", default=None, help="Usa dumps reais do IMDb em vez de dados sintéticos")
+    parser.add_argument("--ext", default=".tsv.gz", help="Extensão dos dumps reais")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.data_dir:
+            data_dir, ext = Path(args.data_dir), args.ext
+        else:
+            data_dir, ext = Path(tmp), ".tsv"
+            print(f"🛠️  Gerando {args.rows:,} linhas sintéticas de title.principals...")
+            generate_dumps(data_dir, args.rows)
+
+        n_principals = sum(len(chunk) for chunk in pd.read_csv(
+            data_dir / f"title.principals{ext}", usecols=['tconst'], chunksize=args.chunksize, **TSV_OPTIONS
+        ))
+
+        start = time.perf_counter()
+        profiles = build_crew_profiles(data_dir, chunksize=args.chunksize, ext=ext)
+        elapsed = time.perf_counter() - start
+
+    print(f"⏱️  {len(profiles):,} perfis gerados em {elapsed:.2f}s")
+    print(f"🚀 Vazão: {n_principals / elapsed:,.0f} linhas de title.principals/s")
+
+
+if __name__ == "__main__":
+    main()
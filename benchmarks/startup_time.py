@@ -0,0 +1,123 @@
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+FRAMEWORK_MODULES = ["streamlit"]
+
+FIRST_KPI_MODULES = [
+    "config",
+    "utils.data_loader",
+    "utils.styles",
+    "components.sidebar",
+    "components.kpis",
+]
+
+TAB_MODULES = [
+    "tabs.evolucao_temporal",
+    "tabs.analise_genero",
+    "tabs.duracao_formato",
+    "tabs.mercado_global",
+    "tabs.hall_fama",
+]
+
+HEAVY_MODULES = ["plotly.express", "matplotlib", "wordcloud"]
+
+
+def measure_imports(modules, preload=()):
+    statements = [f"import {m}" for m in preload]
+    statements.append("import sys; sys.stderr.write('--- measure ---\\n')")
+    statements += [f"import {m}" for m in modules]
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(statements)],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        errors = proc.stderr.strip().splitlines()
+        sys.exit(errors[-1] if errors else f"Falha ao importar {', '.join(modules)} (código {proc.returncode})")
+
+    lines = proc.stderr.split("--- measure ---\n", 1)[-1].splitlines()
+
+    timings = {}
+    total_us = 0
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = len(name) - len(name.lstrip())
+        name = name.strip()
+        timings[name] = int(cumulative)
+        if depth == 1:
+            total_us += int(cumulative)
+
+    return timings, total_us
+
+
+def top_level(timings, prefixes):
+    return {
+        p: timings.get(p, 0) for p in prefixes
+        if any(n == p or n.startswith(p + ".") for n in timings)
+    }
+
+
+def positive_int(value):
+    value = int(value)
+    if value < 1:
+        raise argparse.ArgumentTypeError("deve ser pelo menos 1")
+    return value
+
+
+def median(values):
+    return sorted(values)[len(values) // 2]
+
+
+def measure_median(modules, preload, runs):
+    samples = [measure_imports(modules, preload) for _ in range(runs)]
+    names = set().union(*(timings for timings, _ in samples))
+    timings = {n: median([t.get(n, 0) for t, _ in samples]) for n in names}
+    return timings, median([total for _, total in samples])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o custo de importação até o primeiro KPI do dashboard.")
+    parser.add_argument("--runs", type=positive_int, default=5, help="Execuções por medição (totais e módulos usam a mediana)")
+    parser.add_argument("--budget", type=float, default=None, help="Tempo máximo (s) das importações do app até o primeiro KPI, sem contar o streamlit")
+    args = parser.parse_args()
+
+    framework_timings, framework_us = measure_median(FRAMEWORK_MODULES, (), args.runs)
+    _, eager_us = measure_median(FIRST_KPI_MODULES + TAB_MODULES, FRAMEWORK_MODULES, args.runs)
+    kpi_timings, kpi_us = measure_median(FIRST_KPI_MODULES, FRAMEWORK_MODULES, args.runs)
+    _, tab_us = measure_median(TAB_MODULES, FRAMEWORK_MODULES + FIRST_KPI_MODULES, args.runs)
+
+    framework_plotly = sorted(n for n in framework_timings if n == "plotly" or n.startswith("plotly."))
+
+    print(f"⏱️  Importação do streamlit:                   {framework_us / 1e6:.3f}s")
+    if framework_plotly:
+        print(f"    (o próprio streamlit já carrega {len(framework_plotly)} módulos do plotly, ex.: {', '.join(framework_plotly[:3])})")
+    print(f"⏱️  Antes (KPIs + todas as abas na importação): {eager_us / 1e6:.3f}s")
+    print(f"⏱️  Agora (importações do app até o 1º KPI):    {kpi_us / 1e6:.3f}s")
+    for name in FIRST_KPI_MODULES:
+        print(f"    {name:<28} {kpi_timings.get(name, 0) / 1e6:.3f}s")
+    print(f"🚀 Ganho até o primeiro KPI:                 {(eager_us - kpi_us) / 1e6:.3f}s")
+    print(f"⏱️  Todas as seções (sob demanda):             {tab_us / 1e6:.3f}s")
+
+    failures = []
+
+    leaked = top_level(kpi_timings, HEAVY_MODULES)
+    if leaked:
+        failures.append(f"Módulos pesados importados pelo app antes do primeiro KPI: {', '.join(leaked)}")
+
+    if args.budget is not None and kpi_us / 1e6 > args.budget:
+        failures.append(f"Importações do app até o primeiro KPI ({kpi_us / 1e6:.3f}s) excedem o limite de {args.budget:.3f}s")
+
+    for failure in failures:
+        print(f"⚠️ {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,6 +35,6 @@ def render_sidebar(df):
         )
         
         st.markdown("---")
-        st.info("💡 **Dica:** Os filtros laterais afetam todas as abas, exceto o 'Hall da Fama'.")
+        st.info("💡 **Dica:** Os filtros laterais afetam todas as seções, exceto o 'Hall da Fama'.")
     
     return selected_genres, year_range
\ No newline at end of file
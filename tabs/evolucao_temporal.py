@@ -72,7 +72,7 @@ def render_galeria_icones(df_filtered, df_crew, selected_genres, df):
         st.subheader("🏆 Galeria: Destaques da Década")
         st.caption(f"Os nomes que definiram a era (Filtrado por: {', '.join(selected_genres)})")
     with c_head2:
-        ranking_metric = st.radio("Critério de Seleção:", ["Popularidade (Votos)", "Prestígio (Nota Média)"], horizontal=True)
+        ranking_metric = st.radio("Critério de Seleção:", ["Popularidade (Votos)", "Prestígio (Nota Média)"], horizontal=True, key="galeria_criterio")
 
     sort_col = 'total_votes' if "Votos" in ranking_metric else 'mean_rating'
     
@@ -13,9 +13,9 @@ def render_hall_fama(df_crew):
         col_sel1, col_sel2 = st.columns(2) 
         
         with col_sel1: 
-            role = st.selectbox("Cargo", ["director", "actor", "actress"], format_func=lambda x: {"director": "Diretor(a)", "actor": "Ator", "actress": "Atriz"}.get(x, x))
+            role = st.selectbox("Cargo", ["director", "actor", "actress"], format_func=lambda x: {"director": "Diretor(a)", "actor": "Ator", "actress": "Atriz"}.get(x, x), key="hall_fama_cargo")
         with col_sel2: 
-            dec = st.selectbox("Década", sorted(df_crew['decade'].unique(), reverse=True))
+            dec = st.selectbox("Década", sorted(df_crew['decade'].unique(), reverse=True), key="hall_fama_decada")
     
     st.markdown("---")
 
@@ -0,0 +1,176 @@
+import argparse
+import csv
+from pathlib import Path
+
+import pandas as pd
+
+ROLES = ["director", "actor", "actress"]
+TITLE_TYPES = ["movie"]
+CHUNKSIZE = 2_000_000
+
+KEYS = ['nconst', 'category', 'decade']
+PROFILE_COLUMNS = [
+    'nconst', 'primaryName', 'category', 'decade',
+    'mean_rating', 'total_votes', 'total_movies',
+    'top_movie_title', 'top_movie_year'
+]
+
+TSV_OPTIONS = dict(sep='\t', na_values='\\N', quoting=csv.QUOTE_NONE, low_memory=False)
+
+
+def _imdb_id(col):
+    return col.str.slice(2).astype('int64')
+
+
+def _format_id(col, prefix):
+    return prefix + col.astype(str).str.zfill(7)
+
+
+def load_movies(basics_path, ratings_path, title_types=TITLE_TYPES, chunksize=CHUNKSIZE):
+    reader = pd.read_csv(
+        basics_path, usecols=['tconst', 'titleType', 'primaryTitle', 'startYear'],
+        chunksize=chunksize, **TSV_OPTIONS
+    )
+
+    frames = []
+    for chunk in reader:
+        frames.append(chunk[chunk['titleType'].isin(title_types)].dropna(subset=['startYear']))
+    basics = pd.concat(frames, ignore_index=True)
+
+    ratings = pd.read_csv(ratings_path, usecols=['tconst', 'averageRating', 'numVotes'], **TSV_OPTIONS)
+
+    movies = basics.merge(ratings, on='tconst', how='inner')
+    movies['tconst'] = _imdb_id(movies['tconst'])
+    movies['startYear'] = movies['startYear'].astype('int32')
+    movies['decade'] = (movies['startYear'] // 10 * 10).astype('int32')
+    movies['numVotes'] = movies['numVotes'].astype('int64')
+
+    return movies.drop(columns='titleType').set_index('tconst')
+
+
+def _aggregate_credits(credits):
+    grouped = credits.groupby(KEYS, sort=False)
+    partial = grouped.agg(
+        rating_sum=('averageRating', 'sum'),
+        total_votes=('numVotes', 'sum'),
+        total_movies=('averageRating', 'size')
+    )
+
+    top = credits.sort_values('numVotes', ascending=False, kind='stable').drop_duplicates(KEYS)
+    top = top.set_index(KEYS)[['numVotes', 'primaryTitle', 'startYear']]
+    top.columns = ['top_movie_votes', 'top_movie_title', 'top_movie_year']
+
+    return partial.join(top).reset_index()
+
+
+def _aggregate_partials(partials):
+    grouped = partials.groupby(KEYS, sort=False)
+    totals = grouped[['rating_sum', 'total_votes', 'total_movies']].sum()
+
+    top = partials.sort_values('top_movie_votes', ascending=False, kind='stable').drop_duplicates(KEYS)
+    top = top.set_index(KEYS)[['top_movie_votes', 'top_movie_title', 'top_movie_year']]
+
+    return totals.join(top).reset_index()
+
+
+def iter_credits(principals_path, movies, roles=ROLES, chunksize=CHUNKSIZE):
+    reader = pd.read_csv(
+        principals_path, usecols=['tconst', 'nconst', 'category'],
+        chunksize=chunksize, **TSV_OPTIONS
+    )
+
+    carry, finished = None, set()
+    for chunk in reader:
+        chunk = chunk[chunk['category'].isin(roles)]
+        chunk = chunk.assign(tconst=_imdb_id(chunk['tconst']), nconst=_imdb_id(chunk['nconst']))
+        chunk = chunk[chunk['tconst'].isin(movies.index)]
+
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        if chunk.empty:
+            carry = None
+            continue
+
+        # each title's credits must be contiguous (the dumps are sorted by the
+        # tconst string, not numerically) so the last title can be held back and
+        # never split across two chunks before deduplication
+        runs = (chunk['tconst'] != chunk['tconst'].shift()).sum()
+        if runs != chunk['tconst'].nunique() or chunk['tconst'].isin(finished).any():
+            raise ValueError(
+                f"{principals_path} não está agrupado por tconst; "
+                "ordene o arquivo antes de gerar os perfis para não contar créditos em dobro."
+            )
+
+        last = chunk['tconst'].iat[-1]
+        tail = chunk['tconst'] == last
+        carry, chunk = chunk[tail], chunk[~tail]
+        finished.update(chunk['tconst'].unique())
+
+        if not chunk.empty:
+            yield chunk
+
+    if carry is not None and not carry.empty:
+        yield carry
+
+
+def load_names(names_path, nconsts, chunksize=CHUNKSIZE):
+    reader = pd.read_csv(
+        names_path, usecols=['nconst', 'primaryName'], chunksize=chunksize, **TSV_OPTIONS
+    )
+
+    frames = []
+    for chunk in reader:
+        chunk['nconst'] = _imdb_id(chunk['nconst'])
+        frames.append(chunk[chunk['nconst'].isin(nconsts)])
+
+    return pd.concat(frames, ignore_index=True).drop_duplicates('nconst')
+
+
+def build_crew_profiles(data_dir, roles=ROLES, title_types=TITLE_TYPES, chunksize=CHUNKSIZE, ext=".tsv.gz"):
+    data_dir = Path(data_dir)
+    movies = load_movies(data_dir / f"title.basics{ext}", data_dir / f"title.ratings{ext}", title_types, chunksize)
+
+    partials, buffered, limit = [], 0, chunksize
+    for credits in iter_credits(data_dir / f"title.principals{ext}", movies, roles, chunksize):
+        credits = credits.drop_duplicates(['tconst', 'nconst', 'category'])
+        credits = credits.join(movies, on='tconst')
+        partials.append(_aggregate_credits(credits))
+        buffered += len(partials[-1])
+
+        if buffered > limit and len(partials) > 1:
+            partials = [_aggregate_partials(pd.concat(partials, ignore_index=True))]
+            buffered = len(partials[0])
+            limit = max(chunksize, 2 * buffered)
+
+    if not partials:
+        return pd.DataFrame(columns=PROFILE_COLUMNS)
+
+    profiles = _aggregate_partials(pd.concat(partials, ignore_index=True))
+
+    profiles['mean_rating'] = profiles['rating_sum'] / profiles['total_movies']
+
+    names = load_names(data_dir / f"name.basics{ext}", profiles['nconst'].unique(), chunksize)
+    profiles = profiles.merge(names, on='nconst', how='left')
+    profiles['nconst'] = _format_id(profiles['nconst'], "nm")
+
+    profiles = profiles.sort_values(['decade', 'category', 'total_votes'], ascending=[True, True, False])
+    return profiles[PROFILE_COLUMNS].reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera imdb_crew_profiles.csv a partir dos dumps TSV do IMDb.")
+    parser.add_argument("data_dir", help="Pasta com title.principals, title.ratings, title.basics e name.basics")
+    parser.add_argument("-o", "--output", default="imdb_crew_profiles.csv")
+    parser.add_argument("--roles", nargs="+", default=ROLES, help="Categorias de title.principals a incluir")
+    parser.add_argument("--title-types", nargs="+", default=TITLE_TYPES, help="Valores de titleType a incluir")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE, help="Linhas lidas por bloco")
+    parser.add_argument("--ext", default=".tsv.gz", help="Extensão dos arquivos (.tsv.gz ou .tsv)")
+    args = parser.parse_args()
+
+    profiles = build_crew_profiles(args.data_dir, args.roles, args.title_types, args.chunksize, args.ext)
+    profiles.to_csv(args.output, index=False)
+    print(f"✅ {len(profiles):,} perfis salvos em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,18 +12,19 @@ def apply_custom_styles():
             padding: 10px;
             border-radius: 5px;
         }}
-        .stTabs [data-baseweb="tab-list"] {{ gap: 10px; }}
-        .stTabs [data-baseweb="tab"] {{
+        .st-key-section div[role="radiogroup"] {{ gap: 10px; }}
+        .st-key-section div[role="radiogroup"] > label {{
             height: 50px;
             background-color: {COLOR_SEC};
             border-radius: 5px 5px 0px 0px;
-            padding-top: 10px;
+            padding: 10px 15px 0px 15px;
+            margin-right: 0px;
         }}
-        .stTabs [aria-selected="true"] {{
+        .st-key-section div[role="radiogroup"] > label:has(input:checked) {{
             background-color: {COLOR_ACCENT};
-            color: black !important;
             font-weight: bold;
         }}
+        .st-key-section div[role="radiogroup"] > label:has(input:checked) p {{ color: black !important; }}
         div.stButton > button:first-child {{
             width: 100%;
             background-color: #262730;